@@ -9,42 +9,102 @@ download audiobooks, decrypt them to a standard .m4b format, and
 clean up the intermediate files.
 """
 
+import collections
 import configparser
+import functools
+import io
 import json
+import os
 import pathlib
+import queue
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 
 import click
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
 # --- SCRIPT METADATA (FIX) ---
 # This section was missing, causing the NameError.
 __version__ = "2.0.1"
 __author__ = "JaegerMaster & Gemini"
 # -----------------------------
 
+DEFAULT_NUM_THREADS = 4
+MAX_NUM_THREADS = 10
+LIBRARY_CACHE_DIR = pathlib.Path("~/.cache/audible-dl")
+
+# Serializes console output and guards the set of ASINs currently being processed.
+_lock = threading.Lock()
+_in_flight: set = set()
+_SENTINEL = object()
+
+# Matches the quality/codec suffix audible-cli appends to downloaded file names.
+_STEM_RE = re.compile(r'(-AAX.*|-LC.*)$')
+_ASIN_RE = re.compile(r'B[0-9A-Z]{9}')
+COVER_EXTENSIONS = ('.jpg', '.jpeg')
+
+def echo(message: str = "", **styles) -> None:
+    """Thread-safe wrapper around click.secho."""
+    with _lock:
+        click.secho(message, **styles)
+
 # --- Configuration ---
+@functools.lru_cache(maxsize=1)
 def get_config() -> configparser.ConfigParser:
-    """Reads and returns the configuration from config.ini."""
+    """Reads and returns the configuration from config.ini. The result is cached; treat it as read-only."""
     config = configparser.ConfigParser()
     config_file = pathlib.Path(__file__).parent / "config.ini"
     if not config_file.exists():
         click.secho(f"Error: Configuration file not found at {config_file}", fg="red")
         click.echo("Please copy 'config.ini.example' to 'config.ini' and fill it out.")
         sys.exit(1)
-    config.read(config_file)
+    config.read_string(config_file.read_bytes().decode(), source=str(config_file))
     return config
 
+def get_num_threads(config: configparser.ConfigParser, requested: Optional[int] = None) -> int:
+    """Resolves the number of parallel downloads from the CLI option or config.ini."""
+    if requested is None:
+        requested = config.getint('Settings', 'num_threads', fallback=DEFAULT_NUM_THREADS)
+    return max(1, min(requested, MAX_NUM_THREADS))
+
+@functools.cache
+def _settings() -> Dict:
+    """Resolves the startup settings derived from config.ini once per process."""
+    config = get_config()
+    return {
+        'config': config,
+        'output_dir': pathlib.Path(config.get('Settings', 'output_dir', fallback='~/Downloads/audiobooks')).expanduser(),
+    }
+
 # --- Core Functions ---
 def validate_asin(asin: str) -> bool:
-    """Validate ASIN format."""
-    return len(asin) == 10 and asin.startswith('B')
+    """Validate ASIN format: 'B' followed by nine uppercase letters or digits."""
+    return _ASIN_RE.fullmatch(asin) is not None
 
 def run_command(cmd: List[str]) -> subprocess.CompletedProcess:
-    """Runs a command and captures its output."""
-    return subprocess.run(cmd, capture_output=True, text=True, check=True)
+    """Runs a command and captures its output. stdin is detached so concurrent runs never read the terminal."""
+    return subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, check=True)
+
+def run_streaming(cmd: List[str], tail_lines: int = 50) -> tuple[int, str]:
+    """
+    Runs a command while reading its stderr line by line, keeping only the last
+    `tail_lines` lines for error reporting. Returns (returncode, stderr_tail).
+    stdin is detached so concurrent runs never read the terminal.
+    """
+    with subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, bufsize=1) as process:
+        tail = collections.deque(maxlen=tail_lines)
+        for line in process.stderr:
+            tail.append(line)
+        return process.wait(), ''.join(tail)
 
 def download_audiobook(asin: str, output_dir: pathlib.Path, profile: Optional[str]) -> tuple[bool, Optional[str]]:
     """Download audiobook using audible-cli."""
@@ -64,10 +124,10 @@ def download_audiobook(asin: str, output_dir: pathlib.Path, profile: Optional[st
 
 def get_aaxc_credentials(voucher_file: pathlib.Path) -> tuple[str, str]:
     """Extract decryption credentials from voucher file."""
-    if not voucher_file.exists():
+    try:
+        voucher_data = _json.loads(voucher_file.read_bytes())
+    except FileNotFoundError:
         raise click.ClickException(f"Voucher file not found: {voucher_file}")
-    
-    voucher_data = json.loads(voucher_file.read_text())
     content_license = voucher_data.get('content_license', {}).get('license_response', {})
     key, iv = content_license.get('key'), content_license.get('iv')
     if not key or not iv:
@@ -80,126 +140,296 @@ def decrypt_audiobook(input_file: pathlib.Path, output_dir: pathlib.Path, creden
     output_file = output_dir / input_file.with_suffix('.m4b').name
     try:
         cmd = [
-            'ffmpeg', '-y', '-audible_key', key, '-audible_iv', iv, '-i', str(input_file),
+            'ffmpeg', '-nostdin', '-hide_banner', '-loglevel', 'error', '-nostats', '-y',
+            '-audible_key', key, '-audible_iv', iv, '-i', str(input_file),
             '-map', '0:a', '-map', '0:t?', '-c', 'copy', '-f', 'mp4', str(output_file)
         ]
-        process = subprocess.run(cmd, capture_output=True, text=True)
-        if process.returncode != 0:
-            click.secho(f"FFmpeg error: {process.stderr}", fg='red')
+        returncode, stderr_tail = run_streaming(cmd)
+        if returncode != 0:
+            echo(f"FFmpeg error: {stderr_tail}", fg='red')
             return False, None
         if not output_file.exists() or output_file.stat().st_size == 0:
-            click.secho("Error: FFmpeg created an empty output file.", fg='red')
+            echo("Error: FFmpeg created an empty output file.", fg='red')
             return False, None
         return True, output_file
     except Exception as e:
-        click.secho(f"Decryption error: {str(e)}", fg='red')
+        echo(f"Decryption error: {str(e)}", fg='red')
         return False, None
 
 def find_aaxc_file(directory: pathlib.Path) -> Optional[pathlib.Path]:
-    """Find the first AAXC file in the directory."""
-    return next(iter(directory.glob("*.aaxc")), None)
+    """Find the first AAXC file in the directory, stopping at the first match."""
+    with os.scandir(directory) as entries:
+        return next((pathlib.Path(entry.path) for entry in entries if entry.name.endswith('.aaxc')), None)
 
-def get_related_files(aaxc_file: pathlib.Path) -> List[pathlib.Path]:
+def get_related_files(aaxc_file: pathlib.Path) -> List[str]:
     """
     Robustly finds all related files for cleanup based on the AAXC filename.
+    Returns plain path strings straight from the directory scan.
     """
     directory = aaxc_file.parent
     stem = aaxc_file.stem
     
-    match = re.search(r'(-AAX.*|-LC.*)$', stem)
+    match = _STEM_RE.search(stem)
     if not match:
-        click.secho(f"Warning: Could not determine base name from '{stem}'. Cleanup may be incomplete.", fg='yellow')
+        echo(f"Warning: Could not determine base name from '{stem}'. Cleanup may be incomplete.", fg='yellow')
         base_name = stem
     else:
         base_name = stem[:match.start()]
 
-    related = [
-        aaxc_file,
-        aaxc_file.with_suffix('.voucher'),
-        directory / f"{base_name}-chapters.json"
-    ]
-    related.extend(directory.glob(f"{base_name}*.[jJ][pP][gG]"))
-    related.extend(directory.glob(f"{base_name}*.[jJ][pP][eE][gG]"))
-    
-    return [f for f in related if f.exists()]
+    # A single directory pass; DirEntry names avoid a stat() per candidate file.
+    exact_names = {aaxc_file.name, aaxc_file.with_suffix('.voucher').name, f"{base_name}-chapters.json"}
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name in exact_names
+            or (entry.name.startswith(base_name) and entry.name.lower().endswith(COVER_EXTENSIONS))
+        ]
 
-def cleanup_files(files_to_remove: List[pathlib.Path]):
-    """Clean up temporary files."""
-    click.echo("\nCleaning up intermediate files...")
+def cleanup_files(files_to_remove: List[str]):
+    """
+    Clean up temporary files. Files that are already gone are skipped silently.
+    The report is written in one go so it stays together when books run in parallel.
+    """
+    report = io.StringIO()
+    report.write("\nCleaning up intermediate files...")
     for file in files_to_remove:
+        name = os.path.basename(file)
         try:
-            file.unlink()
-            click.echo(f"Removed: {file.name}")
-        except Exception as e:
-            click.secho(f"Warning: Could not remove {file.name}: {str(e)}", fg='yellow')
+            os.unlink(file)
+            report.write(f"\nRemoved: {name}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            report.write("\n" + click.style(f"Warning: Could not remove {name}: {str(e)}", fg='yellow'))
+    echo(report.getvalue())
 
 def verify_decrypted_file(file_path: pathlib.Path) -> bool:
-    """Verify the decrypted file is a valid media file."""
+    """
+    Verify the decrypted file is a valid media file with an audio stream.
+    Uses ffprobe, which only reads the container metadata instead of decoding the whole book.
+    """
     try:
-        cmd = ['ffmpeg', '-v', 'error', '-i', str(file_path), '-f', 'null', '-']
-        return subprocess.run(cmd, capture_output=True, text=True).returncode == 0
+        cmd = ['ffprobe', '-v', 'error', '-show_entries', 'stream=codec_type,duration', '-of', 'json', str(file_path)]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            return False
+        streams = json.loads(result.stdout).get('streams', [])
+        return any(stream.get('codec_type') == 'audio' for stream in streams)
     except Exception:
         return False
 
-def parse_library_list_output(text_output: str) -> List[Dict]:
-    """Converts the 'ASIN: Author: Title' text format into a structured list."""
-    library_data = []
-    for line in text_output.strip().split('\n'):
-        if not line: continue
+def load_library(profile: Optional[str], config: configparser.ConfigParser) -> List[Dict]:
+    """
+    Returns the library as a list of dicts, using a JSON export cached under
+    ~/.cache/audible-dl/ until it is older than `library_cache_ttl` seconds.
+    """
+    cache_name = f"library-{profile}.json" if profile else "library.json"
+    cache = (LIBRARY_CACHE_DIR / cache_name).expanduser()
+    ttl = config.getint('Settings', 'library_cache_ttl', fallback=3600)
+
+    library_data = None
+    if cache.exists() and time.time() - cache.stat().st_mtime < ttl:
         try:
-            asin, author, title = [part.strip() for part in line.split(':', 2)]
-            library_data.append({'asin': asin, 'title': title, 'authors': [{'name': author}]})
+            library_data = _json.loads(cache.read_bytes())
         except ValueError:
-            click.secho(f"Warning: Could not parse library line: '{line}'", fg='yellow')
+            library_data = None
+
+    if library_data is None:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache.with_suffix('.tmp')
+        cmd = ['audible']
+        if profile:
+            cmd.extend(['--profile', profile])
+        cmd.extend(['library', 'export', '--format', 'json', '--output', str(tmp_file)])
+        try:
+            run_command(cmd)
+            library_data = _json.loads(tmp_file.read_bytes())
+            # Only replace the cache once the export has succeeded and parses.
+            os.replace(tmp_file, cache)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+    # The export stores authors as one comma-separated string.
+    for item in library_data:
+        if isinstance(item.get('authors'), str):
+            item['authors'] = [{'name': name.strip()} for name in item['authors'].split(',') if name.strip()]
     return library_data
 
-def process_book(asin: str, output_dir: pathlib.Path, keep_files: bool, profile: Optional[str]):
-    """Main logic to download, decrypt, and clean up a single book."""
+def remove_empty_dir(directory: pathlib.Path):
+    """Removes a per-book working directory if nothing is left in it."""
+    try:
+        directory.rmdir()
+    except OSError:
+        pass
+
+def book_failed(asin: str, message: str) -> Dict:
+    """Reports a failed book and returns its status dict."""
+    echo(f"[{asin}] Error: {message}", fg='red')
+    return {'asin': asin, 'success': False, 'error': message, 'output_file': None}
+
+def fetch_book(asin: str, output_dir: pathlib.Path, profile: Optional[str]) -> Dict:
+    """
+    Download stage: fetches a book into its own `output_dir / asin` working directory
+    so that concurrent workers never pick up each other's AAXC files. On success the
+    status dict also carries 'aaxc_file' and 'work_dir' for the decrypt stage.
+    """
     if not validate_asin(asin):
-        click.secho(f"Error: Invalid ASIN format: {asin}", fg='red'); sys.exit(1)
+        return book_failed(asin, f"Invalid ASIN format: {asin}")
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    click.echo(f"\nDownloading audiobook with ASIN: {asin}")
-    
-    success, error = download_audiobook(asin, output_dir, profile)
+    work_dir = output_dir / asin
+    work_dir.mkdir(parents=True, exist_ok=True)
+    echo(f"\n[{asin}] Downloading audiobook...")
+
+    success, error = download_audiobook(asin, work_dir, profile)
     if not success:
-        click.secho(f"Error: {error}", fg='red'); sys.exit(1)
+        remove_empty_dir(work_dir)
+        return book_failed(asin, error)
 
     # Re-scan for the aaxc file after download
-    aaxc_file = find_aaxc_file(output_dir)
+    aaxc_file = find_aaxc_file(work_dir)
     if not aaxc_file:
-        click.secho("Error: No AAXC file found in output directory after download.", fg='red'); sys.exit(1)
-    click.echo(f"Found AAXC file: {aaxc_file.name}")
-
+        remove_empty_dir(work_dir)
+        return book_failed(asin, "No AAXC file found in output directory after download.")
+    echo(f"[{asin}] Found AAXC file: {aaxc_file.name}")
+    return {'asin': asin, 'success': True, 'error': None, 'output_file': None, 'aaxc_file': aaxc_file, 'work_dir': work_dir}
+
+def finish_book(job: Dict, output_dir: pathlib.Path, keep_files: bool) -> Dict:
+    """Decrypt stage: decrypts, verifies and cleans up a book downloaded by fetch_book."""
+    asin, aaxc_file, work_dir = job['asin'], job['aaxc_file'], job['work_dir']
     try:
         credentials = get_aaxc_credentials(aaxc_file.with_suffix('.voucher'))
-        click.echo("Successfully extracted decryption credentials.")
+        echo(f"[{asin}] Successfully extracted decryption credentials.")
     except Exception as e:
-        click.secho(f"Error: {str(e)}", fg='red'); sys.exit(1)
+        return book_failed(asin, str(e))
 
-    click.echo("\nDecrypting audiobook...")
+    echo(f"[{asin}] Decrypting audiobook...")
     success, output_file = decrypt_audiobook(aaxc_file, output_dir, credentials)
     if not success or not output_file:
-        click.secho("Error: Failed to decrypt audiobook.", fg='red'); sys.exit(1)
+        return book_failed(asin, "Failed to decrypt audiobook.")
 
-    click.echo("\nVerifying decrypted file...")
+    echo(f"[{asin}] Verifying decrypted file...")
     if not verify_decrypted_file(output_file):
-        click.secho("Error: Decrypted file verification failed.", fg='red')
         if output_file.exists(): output_file.unlink()
-        sys.exit(1)
+        return book_failed(asin, "Decrypted file verification failed.")
 
     if not keep_files:
         cleanup_files(get_related_files(aaxc_file))
+        remove_empty_dir(work_dir)
     else:
-        click.echo("\nKeeping all intermediate files as requested.")
+        echo(f"[{asin}] Keeping all intermediate files in {work_dir} as requested.")
 
-    click.secho("\nProcess completed successfully!", fg='green')
-    click.echo(f"Decrypted audiobook: {output_file.name}")
+    echo(f"[{asin}] Process completed successfully!", fg='green')
+    echo(f"[{asin}] Decrypted audiobook: {output_file.name}")
     if output_file.exists():
-        click.echo(f"File size: {output_file.stat().st_size / (1024 * 1024):.2f} MB")
+        echo(f"[{asin}] File size: {output_file.stat().st_size / (1024 * 1024):.2f} MB")
+    return {'asin': asin, 'success': True, 'error': None, 'output_file': output_file}
+
+def process_book(asin: str, output_dir: pathlib.Path, keep_files: bool, profile: Optional[str]) -> Dict:
+    """
+    Main logic to download, decrypt, and clean up a single book.
+    Returns a status dict with the keys 'asin', 'success', 'error' and 'output_file'.
+    """
+    job = fetch_book(asin, output_dir, profile)
+    if not job['success']:
+        return job
+    return finish_book(job, output_dir, keep_files)
+
+def download_books(asins: List[str], output_dir: pathlib.Path, keep_files: bool, profile: Optional[str], num_threads: int) -> List[Dict]:
+    """
+    Processes several books as a two-stage pipeline and prints a summary of the results.
+
+    A pool of `num_threads` downloaders pushes finished downloads onto a queue while a
+    separate pool of decrypters pops them and runs ffmpeg, so the network and the
+    CPU are kept busy at the same time.
+    """
+    results = []
+    download_queue: queue.Queue = queue.Queue()
+    num_decrypters = max(1, (os.cpu_count() or 2) // 2)
+    cancelled = threading.Event()
+
+    def record(result: Dict):
+        with _lock:
+            results.append(result)
+            _in_flight.discard(result['asin'])
+
+    def downloader(asin: str):
+        try:
+            job = fetch_book(asin, output_dir, profile)
+        except Exception as e:
+            job = book_failed(asin, str(e))
+        if job['success']:
+            download_queue.put(job)
+        else:
+            record(job)
+
+    def decrypter():
+        while True:
+            job = download_queue.get()
+            if job is _SENTINEL or cancelled.is_set():
+                break
+            try:
+                record(finish_book(job, output_dir, keep_files))
+            except Exception as e:
+                record(book_failed(job['asin'], str(e)))
+
+    decrypt_pool = ThreadPoolExecutor(max_workers=num_decrypters)
+    download_pool = ThreadPoolExecutor(max_workers=max(1, min(num_threads, len(asins))))
+    decrypters = [decrypt_pool.submit(decrypter) for _ in range(num_decrypters)]
+
+    def stop_decrypters():
+        for _ in range(num_decrypters):
+            download_queue.put(_SENTINEL)
 
-def browse_and_download_mode(output_dir: pathlib.Path, keep_files: bool, profile: Optional[str], config: configparser.ConfigParser):
-    """Fetches library, displays it with pagination, and lets the user choose a book."""
+    try:
+        for asin in asins:
+            with _lock:
+                if asin in _in_flight:
+                    continue
+                _in_flight.add(asin)
+            download_pool.submit(downloader, asin)
+        download_pool.shutdown(wait=True)
+        # All downloads are done; tell every decrypter to stop once the queue drains.
+        stop_decrypters()
+        for future in decrypters:
+            future.result()
+    except BaseException:
+        # On Ctrl+C drop the downloads that have not started yet and keep the
+        # decrypters from picking up any more queued books.
+        cancelled.set()
+        download_pool.shutdown(wait=False, cancel_futures=True)
+        stop_decrypters()
+        raise
+    finally:
+        decrypt_pool.shutdown(wait=False)
+
+    if len(results) > 1:
+        succeeded = sum(1 for r in results if r['success'])
+        echo(f"\n{succeeded} of {len(results)} books processed successfully.", fg='green' if succeeded == len(results) else 'yellow')
+        for r in results:
+            if not r['success']:
+                echo(f"  {r['asin']}: {r['error']}", fg='red')
+    return results
+
+def parse_selection(user_input: str, total: int) -> Optional[List[int]]:
+    """
+    Parses a selection like '3', '3,5,7', '3 5 7' or 'all' into zero-based indices.
+    Empty entries (e.g. from a trailing comma) are ignored; returns None if any
+    other entry is not a valid book number.
+    """
+    if user_input == 'all':
+        return list(range(total))
+    indices = []
+    for part in re.split(r'[,\s]+', user_input.strip()):
+        if not part:
+            continue
+        if not part.isdigit() or not 1 <= int(part) <= total:
+            return None
+        if int(part) - 1 not in indices:
+            indices.append(int(part) - 1)
+    return indices or None
+
+def browse_and_download_mode(output_dir: pathlib.Path, keep_files: bool, profile: Optional[str], config: configparser.ConfigParser, num_threads: int):
+    """Fetches library, displays it with pagination, and lets the user choose one or more books."""
     try:
         from rich.console import Console
         from rich.table import Table
@@ -209,58 +439,60 @@ def browse_and_download_mode(output_dir: pathlib.Path, keep_files: bool, profile
     console = Console()
     with console.status("[bold green]Fetching your Audible library..."):
         try:
-            lib_cmd = ['audible']
-            if profile:
-                lib_cmd.extend(['--profile', profile])
-            lib_cmd.extend(['library', 'list'])
-            
-            result = run_command(lib_cmd)
-            library_data = parse_library_list_output(result.stdout)
+            library_data = load_library(profile, config)
         except subprocess.CalledProcessError as e:
-            console.print(f"[bold red]Error: The 'audible library list' command failed.[/bold red]\n[yellow]{e.stderr}[/yellow]"); sys.exit(1)
+            console.print(f"[bold red]Error: The 'audible library export' command failed.[/bold red]\n[yellow]{e.stderr}[/yellow]"); sys.exit(1)
+        except ValueError as e:
+            console.print(f"[bold red]Error: The 'audible library export' output could not be parsed.[/bold red]\n[yellow]{e}[/yellow]"); sys.exit(1)
 
     if not library_data:
         console.print("[bold red]Error: No books were found in your library output.[/bold red]"); sys.exit(1)
     
     sort_order = config.get('Settings', 'default_sort', fallback='newest_first')
-    if click.confirm(f"Sort by '{sort_order.replace('_', ' ')}'?", default=True):
-        if sort_order == 'newest_first':
-            library_data.reverse()
-    else:
-        current_sort = 'oldest_first' if sort_order == 'newest_first' else 'newest_first'
-        if current_sort == 'newest_first':
-            library_data.reverse()
-        click.echo(f"Sorting by {current_sort.replace('_', ' ')}.")
-
+    if not click.confirm(f"Sort by '{sort_order.replace('_', ' ')}'?", default=True):
+        sort_order = 'oldest_first' if sort_order == 'newest_first' else 'newest_first'
+        click.echo(f"Sorting by {sort_order.replace('_', ' ')}.")
+    # The export lists the oldest purchases first.
+    if sort_order == 'newest_first':
+        library_data.reverse()
+
+    # Format every row once so paging only slices the list.
+    rows = [
+        (str(i + 1), item.get('title', 'N/A'), ', '.join(a['name'] for a in item.get('authors', [])), item.get('asin', 'N/A'))
+        for i, item in enumerate(library_data)
+    ]
     page_size = config.getint('Settings', 'page_size', fallback=10)
+    total_pages = -(-len(rows) // page_size)
     page_num = 0
     while True:
         start_index = page_num * page_size
         end_index = start_index + page_size
-        page_data = library_data[start_index:end_index]
+        page_rows = rows[start_index:end_index]
         
-        if not page_data:
+        if not page_rows:
             click.echo("No more books."); page_num -= 1; continue
 
-        table = Table(title=f"Your Audible Library - Page {page_num + 1} of {-(-len(library_data) // page_size)}")
+        table = Table(title=f"Your Audible Library - Page {page_num + 1} of {total_pages}")
         table.add_column("#", style="cyan"); table.add_column("Title", style="magenta")
         table.add_column("Author", style="green"); table.add_column("ASIN", style="bold blue")
-        for i, item in enumerate(page_data, start=start_index):
-            authors = ', '.join([a['name'] for a in item.get('authors', [])])
-            table.add_row(str(i + 1), item.get('title', 'N/A'), authors, item.get('asin', 'N/A'))
+        for row in page_rows:
+            table.add_row(*row)
         console.print(table)
         
-        user_input = click.prompt("Enter book # to download, (n)ext, (p)revious, or (q)uit", type=str, default="").lower()
-
-        if user_input.isdigit():
-            choice = int(user_input)
-            if 1 <= choice <= len(library_data):
-                book = library_data[choice - 1]
-                click.echo(f"\nYou selected: '{book['title']}' (ASIN: {book['asin']})")
-                process_book(book['asin'], output_dir, keep_files, profile)
-                break
-            else:
-                click.secho("Invalid book number.", fg='yellow')
+        user_input = click.prompt("Enter book #(s) to download (e.g. 3 or 3,5,7), 'all', (n)ext, (p)revious, or (q)uit", type=str, default="").lower().strip()
+
+        if user_input == 'all' or (user_input and user_input[0].isdigit()):
+            indices = parse_selection(user_input, len(library_data))
+            if indices is None:
+                click.secho("Invalid book number.", fg='yellow'); continue
+            if user_input == 'all' and not click.confirm(f"Download all {len(library_data)} books?", default=False):
+                continue
+            books = [library_data[i] for i in indices]
+            for book in books:
+                click.echo(f"You selected: '{book['title']}' (ASIN: {book['asin']})")
+            results = download_books([book['asin'] for book in books], output_dir, keep_files, profile, num_threads)
+            if not all(r['success'] for r in results): sys.exit(1)
+            break
         elif user_input == 'n':
             if end_index < len(library_data): page_num += 1
             else: click.echo("Already on the last page.")
@@ -276,31 +508,31 @@ def browse_and_download_mode(output_dir: pathlib.Path, keep_files: bool, profile
 @click.option('--asin', '-a', help='The ASIN of the book to download directly.')
 @click.option('--profile', help='The audible-cli profile to use.')
 @click.option('--keep-files', '-k', is_flag=True, help='Keep intermediate files after decryption.')
+@click.option('--num-threads', '-j', type=click.IntRange(min=1), help=f'Number of books to download in parallel (at most {MAX_NUM_THREADS}).')
 @click.version_option(version=__version__)
-def main(asin: Optional[str], profile: Optional[str], keep_files: bool):
+def main(asin: Optional[str], profile: Optional[str], keep_files: bool, num_threads: Optional[int]):
     """
     A tool to download and decrypt your Audible audiobooks.
 
     Run without options for an interactive menu.
     """
-    config = get_config()
-    settings = config['Settings']
-    output_dir_str = settings.get('output_dir', '~/Downloads/audiobooks')
-    output_dir = pathlib.Path(output_dir_str).expanduser()
+    settings = _settings()
+    config, output_dir = settings['config'], settings['output_dir']
+    num_threads = get_num_threads(config, num_threads)
 
     click.secho(f"Audible Downloader v{__version__}", fg='cyan')
     if profile: click.secho(f"Using audible-cli profile: {profile}", fg='green')
 
     if asin:
-        process_book(asin, output_dir, keep_files, profile)
+        if not process_book(asin, output_dir, keep_files, profile)['success']: sys.exit(1)
     else:
         click.echo("\nChoose an option:\n1. Browse library\n2. Download by ASIN")
         choice = click.prompt("Enter your choice", type=click.Choice(['1', '2']))
         if choice == '1':
-            browse_and_download_mode(output_dir, keep_files, profile, config)
+            browse_and_download_mode(output_dir, keep_files, profile, config, num_threads)
         elif choice == '2':
             asin_input = click.prompt("Please enter the book's ASIN")
-            process_book(asin_input, output_dir, keep_files, profile)
+            if not process_book(asin_input, output_dir, keep_files, profile)['success']: sys.exit(1)
 
 if __name__ == '__main__':
     main()